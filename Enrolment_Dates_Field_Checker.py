@@ -9,11 +9,22 @@
 # Enrolment Dates query from Learning Platform
 # Custom Fields query from Learning Platform
 
+# NumPy is optional and is only required for the columnar checker
+
+# Mismatches and per-stage row counts from each run are saved to the
+# Change_History.db SQLite database
+
 import csv
 import re
+import sqlite3
 import sys
 import time
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def add_end_date(students, data_pos):
     """Add End Date to each student's data.
@@ -125,6 +136,29 @@ def check_ed(report_data):
         return False, warnings
 
 
+def check_ed_columns(ed_columns):
+    """Check the columns loaded from the Enrolment Dates data file.
+    
+    Columnar equivalent of check_ed(). Only the columns used by the columnar
+    checker are loaded, so the Student Name is not checked.
+
+    Args:
+        ed_columns (dict): Column arrays keyed by column position.
+
+    File Structure (Enrolment Dates (Learning Platform) data file):
+        Student ID, Student, Course, Enrolment Date, Expiry Date
+    """
+    errors = []
+    checks = [(2, 'Course'), (3, 'Enrolment Date'), (4, 'Expiry Date')]
+    for pos, name in checks:
+        missing = ed_columns[pos] == ''
+        for student_id in ed_columns[0][missing]:
+            errors.append('{} is missing for student with Student ID '
+                          '{}'.format(name, student_id))
+    if len(errors) > 0:
+        process_error_log(errors, 'Enrolment Dates (Learning Platform) Report')
+
+
 def check_repeat():
     """Return True or False for repeating another action.
 
@@ -161,6 +195,47 @@ def check_review_warnings():
             return False
 
 
+def check_upload_all():
+    """Return True or False for saving all current changes to file.
+
+    Returns:
+        True if user wants to include mismatches that persist since the last
+        uploaded run in the upload files, False otherwise.
+    """
+    upload_all = ''
+    while upload_all == '':
+        upload_all = input('\nDo you want to include the mismatches that '
+                           'persist since the last uploaded run in the '
+                           'upload files? y/n --> ')
+        if upload_all not in ('y', 'n'):
+            print('\nThat is not a valid answer! Please try again.')
+            upload_all = ''
+        elif upload_all == 'y':
+            return True
+        else:
+            return False
+
+
+def check_uploaded():
+    """Return True or False for the upload files being used.
+
+    Returns:
+        True if the upload files will be used to update the student
+        profiles, False otherwise.
+    """
+    uploaded = ''
+    while uploaded == '':
+        uploaded = input('\nWill these upload files be used to update the '
+                         'student profiles? y/n --> ')
+        if uploaded not in ('y', 'n'):
+            print('\nThat is not a valid answer! Please try again.')
+            uploaded = ''
+        elif uploaded == 'y':
+            return True
+        else:
+            return False
+
+
 def clean_date(students, date_pos):
     """Returns list with the date column converted to 'DD/MM/YYYY'.
     
@@ -178,7 +253,30 @@ def clean_date(students, date_pos):
     return updated_students
 
 
-def compare(enrolment, custom_field, e_pos, c_pos, es_pos=0, cs_pos=0):
+def clean_date_column(dates):
+    """Returns date column converted to 'DD/MM/YYYY'.
+    
+    Vectorised equivalent of extract_date(). Dates are cut to 'YYYY-MM-DD'
+    and the characters are reordered as a two dimensional character array.
+    
+    Args:
+        dates (array): Date column to be cleaned.
+    
+    Returns:
+        cleaned (array): Cleaned dates.
+    """
+    chars = dates.astype('U10').view('U1').reshape(len(dates), 10)
+    cleaned = np.empty((len(dates), 10), dtype='U1')
+    cleaned[:, 0:2] = chars[:, 8:10]
+    cleaned[:, 2] = '/'
+    cleaned[:, 3:5] = chars[:, 5:7]
+    cleaned[:, 5] = '/'
+    cleaned[:, 6:10] = chars[:, 0:4]
+    return cleaned.view('U10').ravel()
+
+
+def compare(enrolment, custom_field, e_pos, c_pos, es_pos=0, cs_pos=0,
+            course_pos=None):
     """Compare dates to find those that are incorrect in Custom Fields.
     
     Compares dates between the enrolment data and the custom fields data.
@@ -190,6 +288,8 @@ def compare(enrolment, custom_field, e_pos, c_pos, es_pos=0, cs_pos=0):
         c_pos (int): Position of date in Custom Fields data.
         es_pos (int): Position of Student ID in Enrolment Dates data.
         cs_pos (int): Position of Student ID in Custom Fields data.
+        course_pos (int): Position of Course in Enrolment Dates data. If
+        provided the course code is appended to each change.
     
     Returns:
         changes (list): Students needing changing and correct date.
@@ -202,6 +302,9 @@ def compare(enrolment, custom_field, e_pos, c_pos, es_pos=0, cs_pos=0):
                 # Compare dates for student
                 if student[e_pos] != c_student[c_pos]:
                     changed_student = [student[es_pos], student[e_pos]]
+                    if course_pos is not None:
+                        changed_student.append(extract_course_code(
+                            student[course_pos]))
                     changes.append(changed_student)
                     break
                 else:
@@ -209,6 +312,42 @@ def compare(enrolment, custom_field, e_pos, c_pos, es_pos=0, cs_pos=0):
     return changes
 
 
+def compare_columns(e_ids, e_dates, c_ids, c_dates, e_courses=None):
+    """Compare date columns to find those that are incorrect in Custom Fields.
+    
+    Columnar equivalent of compare(). Each Enrolment Dates student is matched
+    to the first Custom Fields entry with the same Student ID.
+    
+    Args:
+        e_ids (array): Student IDs in Enrolment Dates data.
+        e_dates (array): Dates in Enrolment Dates data.
+        c_ids (array): Student IDs in Custom Fields data.
+        c_dates (array): Dates in Custom Fields data.
+        e_courses (array): Courses in Enrolment Dates data. If provided the
+        course code is appended to each change.
+    
+    Returns:
+        changes (list): Students needing changing and correct date.
+    """
+    if len(e_ids) == 0 or len(c_ids) == 0:
+        return []
+    # Stable sort keeps the first Custom Fields entry for each Student ID first
+    order = np.argsort(c_ids, kind='stable')
+    sorted_ids = c_ids[order]
+    pos = np.searchsorted(sorted_ids, e_ids)
+    pos = np.minimum(pos, len(sorted_ids) - 1)
+    found = sorted_ids[pos] == e_ids
+    matched = order[pos]
+    changed = found & (c_dates[matched] != e_dates)
+    changes = []
+    for student_id, date in zip(e_ids[changed], e_dates[changed]):
+        changes.append([str(student_id), str(date)])
+    if e_courses is not None:
+        for change, course in zip(changes, e_courses[changed]):
+            change.append(extract_course_code(course))
+    return changes
+
+
 def confirm_files(o_file, r_files):
     """Print required files and have user press enter to continue.
 
@@ -323,6 +462,31 @@ def extract_course_date(student, data_pos, date_text):
     return course_date
 
 
+def extract_cf_columns(cf_text):
+    """Return the Student ID, Start Date and End Date columns.
+    
+    Extracts all three values from each custom field in a single pass over
+    the custom field text.
+    
+    Args:
+        cf_text (array): Custom field text for students with a Student ID.
+    
+    Returns:
+        Arrays of Student IDs, Course Start Dates and Course End Dates.
+    """
+    ids = []
+    start_dates = []
+    end_dates = []
+    for text in cf_text:
+        student = [text]
+        ids.append(extract_student_id(student, 0))
+        start_dates.append(extract_course_date(student, 0,
+                                               'Course Start Date'))
+        end_dates.append(extract_course_date(student, 0, 'Course End Date'))
+    return (np.array(ids, dtype=str), np.array(start_dates, dtype=str),
+            np.array(end_dates, dtype=str))
+
+
 def extract_date(date):
     """Return the date in the format DD/MM/YYYY.
     
@@ -361,6 +525,19 @@ def extract_students(students, data_pos):
     return updated_students
 
 
+def extract_students_mask(data):
+    """Return mask of students with 'FitNZ' in the custom field.
+    
+    Args:
+        data (array): Custom field column to be checked.
+    
+    Returns:
+        Boolean array, True for students with 'FitNZ'.
+    """
+    return np.fromiter(('FitNZ' in text for text in data), dtype=bool,
+                       count=len(data))
+
+
 def extract_student_id(student, data_pos):
     """Return the student's Student ID.
     
@@ -389,6 +566,23 @@ def generate_time_string():
     return time_str
 
 
+def get_course_history(conn):
+    """Return the number of mismatches for each course and field in each run.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+    
+    Returns:
+        List of (run time, course, field, mismatch count) ordered by run.
+    """
+    return conn.execute('SELECT runs.run_time, changes.course, changes.field, '
+                        'COUNT(*) FROM changes JOIN runs USING (run_id) '
+                        'GROUP BY changes.run_id, changes.course, '
+                        'changes.field '
+                        'ORDER BY changes.run_id, changes.course, '
+                        'changes.field').fetchall()
+
+
 def get_courses(students, course_pos):
     """Return students with a course code in format (XXX-XX-XXX).
     
@@ -406,6 +600,134 @@ def get_courses(students, course_pos):
     return updated_students
 
 
+def get_courses_mask(courses):
+    """Return mask of courses with a course code in format (XXX-XX-XXX).
+    
+    Args:
+        courses (array): Course column.
+        
+    Returns:
+        Boolean array, True for courses with a course code in correct format.
+    """
+    return np.fromiter((extract_course_code(course) != 'Skip' for course in
+                        courses), dtype=bool, count=len(courses))
+
+
+def get_new_changes(conn, run_id, field):
+    """Return changes in a run that were not in the last uploaded run.
+    
+    All changes are new if no earlier run has been uploaded.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+        run_id (int): Run to be checked.
+        field (str): Field to be checked ('Start Date' or 'End Date').
+    
+    Returns:
+        List of [Student ID, date] for the new changes.
+    """
+    previous_id = get_previous_upload(conn, run_id)
+    rows = conn.execute('SELECT student_id, date FROM changes '
+                        'WHERE run_id = ? AND field = ? '
+                        'EXCEPT SELECT student_id, date FROM changes '
+                        'WHERE run_id = ? AND field = ? '
+                        'ORDER BY student_id',
+                        (run_id, field, previous_id, field)).fetchall()
+    return [list(row) for row in rows]
+
+
+def get_previous_upload(conn, run_id):
+    """Return the last run before run_id whose upload files were used.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+        run_id (int): Current run.
+    
+    Returns:
+        The run_id of the last uploaded run, or None if there is none.
+    """
+    return conn.execute('SELECT MAX(run_id) FROM uploads WHERE run_id < ?',
+                        (run_id,)).fetchone()[0]
+
+
+def get_resolved_changes(conn, run_id, field):
+    """Return changes in the last uploaded run that are no longer in a run.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+        run_id (int): Run to be checked.
+        field (str): Field to be checked ('Start Date' or 'End Date').
+    
+    Returns:
+        List of [Student ID, date] for the resolved changes.
+    """
+    previous_id = get_previous_upload(conn, run_id)
+    rows = conn.execute('SELECT student_id, date FROM changes '
+                        'WHERE run_id = ? AND field = ? '
+                        'EXCEPT SELECT student_id, date FROM changes '
+                        'WHERE run_id = ? AND field = ? '
+                        'ORDER BY student_id',
+                        (previous_id, field, run_id, field)).fetchall()
+    return [list(row) for row in rows]
+
+
+def get_stage_metrics(conn):
+    """Return the row count for each processing stage in each run.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+    
+    Returns:
+        List of (run time, stage, row count) ordered by run.
+    """
+    return conn.execute('SELECT runs.run_time, metrics.stage, '
+                        'metrics.row_count '
+                        'FROM metrics JOIN runs USING (run_id) '
+                        'ORDER BY metrics.run_id, metrics.rowid').fetchall()
+
+
+def load_columns(file_name, columns, text_columns=()):
+    """Read only the required columns from a file.
+    
+    Rows without a value in the first column are skipped, as in load_data().
+    Free text columns are stored as object arrays so that one long value does
+    not set the width of every item in a fixed width string array.
+
+    Args:
+        file_name (str): The name of the file to be read.
+        columns (list): Positions of the columns to be read.
+        text_columns (list): Positions of columns that contain free text.
+
+    Returns:
+        read_columns (dict): Column arrays keyed by column position.
+    """
+    read_data = {pos: [] for pos in columns}
+    valid_file = False
+    while valid_file is False:
+        try:
+            file = open(file_name + '.csv', 'r')
+        except IOError:
+            print('The file does not exist. Check file name.')
+            file_name = input('What is the name of the file? ')
+        else:
+            file.readline()
+            reader = csv.reader(file, delimiter=',', quotechar='"')
+            for row in reader:
+                if row[0] not in (None, ''):
+                    for pos in columns:
+                        read_data[pos].append(row[pos])
+            file.close()
+            valid_file = True
+    read_columns = {}
+    for pos in columns:
+        # Release each list once its array has been built
+        if pos in text_columns:
+            read_columns[pos] = np.array(read_data.pop(pos), dtype=object)
+        else:
+            read_columns[pos] = np.array(read_data.pop(pos), dtype=str)
+    return read_columns
+
+
 def load_data(file_name, source):
     """Read data from a file.
 
@@ -455,15 +777,19 @@ def main():
             action = int(input('\nPlease enter the number for your '
                                'selection --> '))
         except ValueError:
-            print('Please enter a number between 1 and 2.')
+            print('Please enter a number between 1 and 4.')
             try_again = True
         else:
-            if int(action) < 1 or int(action) > 2:
-                print('\nPlease select from the available options (1 - 2)')
+            if int(action) < 1 or int(action) > 4:
+                print('\nPlease select from the available options (1 - 4)')
                 try_again = True
             elif action == 1:
                 process_enrolment_dates()
             elif action == 2:
+                process_enrolment_dates_columnar()
+            elif action == 3:
+                process_history()
+            elif action == 4:
                 print('\nIf you have generated any files, please find them '
                       'saved to disk. Goodbye.')
                 sys.exit()
@@ -479,7 +805,97 @@ def main_message():
     print('Created by Jeff Mitchell, 2018')
     print('\nOptions:')
     print('\n1 Check Dates Fields')
-    print('2 Exit')
+    print('2 Check Dates Fields (Columnar)')
+    print('3 View Change History')
+    print('4 Exit')
+
+
+def open_history(db_name='Change_History.db'):
+    """Open the change history database, creating the tables if required.
+    
+    The database is append-only: each run adds a row to runs and its
+    mismatches and stage row counts to changes and metrics. Runs whose upload
+    files were used to update the student profiles are added to uploads.
+    
+    Args:
+        db_name (str): Name of the database file.
+    
+    Returns:
+        conn (Connection): Connection to the history database.
+    """
+    conn = sqlite3.connect(db_name)
+    conn.executescript('CREATE TABLE IF NOT EXISTS runs ('
+                       'run_id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                       'run_time TEXT NOT NULL); '
+                       'CREATE TABLE IF NOT EXISTS changes ('
+                       'run_id INTEGER NOT NULL REFERENCES runs (run_id), '
+                       'field TEXT NOT NULL, student_id TEXT NOT NULL, '
+                       'course TEXT, date TEXT NOT NULL); '
+                       'CREATE TABLE IF NOT EXISTS metrics ('
+                       'run_id INTEGER NOT NULL REFERENCES runs (run_id), '
+                       'stage TEXT NOT NULL, row_count INTEGER NOT NULL); '
+                       'CREATE TABLE IF NOT EXISTS uploads ('
+                       'run_id INTEGER NOT NULL REFERENCES runs (run_id)); '
+                       'CREATE INDEX IF NOT EXISTS changes_run_field '
+                       'ON changes (run_id, field); '
+                       'CREATE INDEX IF NOT EXISTS metrics_run '
+                       'ON metrics (run_id);')
+    return conn
+
+
+def process_changes(start_change, end_change, metrics):
+    """Save changes to the history database and save new changes to file.
+    
+    New changes are those that were not in the last uploaded run, which is
+    not necessarily the previous run. Only new changes are saved to the
+    upload files, unless the user chooses to include the persisting
+    mismatches. The run is recorded as uploaded if the user confirms that
+    its upload files will be used.
+    
+    Args:
+        start_change (list): Students with incorrect Start Date and course
+        code.
+        end_change (list): Students with incorrect End Date and course code.
+        metrics (list): (stage, row count) for each processing stage.
+    """
+    metrics = metrics + [('Start Date mismatches', len(start_change)),
+                         ('End Date mismatches', len(end_change))]
+    changes = {'Start Date': start_change, 'End Date': end_change}
+    new_changes = {}
+    persisting = 0
+    conn = open_history()
+    try:
+        run_id = save_history(conn, changes, metrics)
+        for field in changes:
+            new_changes[field] = get_new_changes(conn, run_id, field)
+            resolved = get_resolved_changes(conn, run_id, field)
+            current = set((change[0], change[1]) for change in
+                          changes[field])
+            field_persisting = len(current) - len(new_changes[field])
+            persisting += field_persisting
+            print('\n{}: {} mismatches, {} new, {} persisting, {} resolved '
+                  'since last uploaded run.'.format(field,
+                                                    len(changes[field]),
+                                                    len(new_changes[field]),
+                                                    field_persisting,
+                                                    len(resolved)))
+        # Save new changes, or all current changes if requested, to csv files
+        if persisting > 0 and check_upload_all():
+            for field in changes:
+                new_changes[field] = [change[:2] for change in
+                                      changes[field]]
+        headings = ('Student ID,Start Date')
+        save_data_upload(new_changes['Start Date'], headings,
+                         'Start_Changes_')
+        headings = ('Student ID,End Date')
+        save_data_upload(new_changes['End Date'], headings, 'End_Changes_')
+        for field in changes:
+            print('{} {} changes written to upload file.'.format(
+                len(new_changes[field]), field))
+        if check_uploaded():
+            save_upload(conn, run_id)
+    finally:
+        conn.close()
 
 
 def process_enrolment_dates():
@@ -531,15 +947,67 @@ def process_enrolment_dates():
     cf_data = strip_cf_data(cf_data)
     # debug_list(cf_data)
     # Compare lists to find Start Date and End Date errors
-    start_change = compare(ed_data, cf_data, 3, 1)
+    start_change = compare(ed_data, cf_data, 3, 1, course_pos=2)
     # debug_list(start_change)
-    end_change = compare(ed_data, cf_data, 4, 2)
+    end_change = compare(ed_data, cf_data, 4, 2, course_pos=2)
     # debug_list(end_change)
-    # Save lists to csv files
-    headings = ('Student ID,Start Date')
-    save_data_upload(start_change, headings, 'Start_Changes_')
-    headings = ('Student ID,End Date')
-    save_data_upload(end_change, headings, 'End_Changes_')
+    # Save to history and save new changes to csv files
+    metrics = [('Enrolment Dates rows', len(raw_ed_data)),
+               ('Enrolment Dates course rows', len(ed_data)),
+               ('Custom Fields rows', len(raw_cf_data)),
+               ('Custom Fields student rows', len(cf_data))]
+    process_changes(start_change, end_change, metrics)
+    process_warning_log(warnings, warnings_to_process)
+
+
+def process_enrolment_dates_columnar():
+    """Find students with incorrect dates using column arrays.
+    
+    Columnar version of process_enrolment_dates(). Only the required columns
+    are loaded and each filter is a boolean mask that is applied once to each
+    column. Falls back to process_enrolment_dates() if NumPy is not
+    installed.
+    """
+    if np is None:
+        print('\nNumPy is not installed. Using the standard checker.')
+        process_enrolment_dates()
+        return
+    warnings = ['\nProcessing Enrolment Dates Warnings:\n']
+    warnings_to_process = False
+    print('\nEnrolment Dates data.')
+    # Confirm the required files are in place
+    required_files = ['Enrolments (Learning Platform)', 'Custom Fields']
+    confirm_files('Enrolment Dates Report', required_files)
+    # Load Student ID, Course, Enrolment Date and Expiry Date columns
+    ed_file_name = input('\nWhat is the name of the Enrolment Dates '
+                         'file? --> ')
+    ed_columns = load_columns(ed_file_name, [0, 2, 3, 4])
+    check_ed_columns(ed_columns)
+    ed_rows = len(ed_columns[0])
+    # Keep only (XXX-XXX-XXX) courses
+    ed_mask = get_courses_mask(ed_columns[2])
+    ed_columns = {pos: column[ed_mask] for pos, column in ed_columns.items()}
+    # Clean dates into DD/MM/YYYY
+    ed_start = clean_date_column(ed_columns[3])
+    ed_end = clean_date_column(ed_columns[4])
+    # Load the custom field text column
+    cf_file_name = input('\nWhat is the name of the Custom Fields file? --> ')
+    cf_columns = load_columns(cf_file_name, [3], text_columns=[3])
+    # Keep only items with a Student ID
+    cf_text = cf_columns[3][extract_students_mask(cf_columns[3])]
+    # Extract Student ID, Course Start Date and Course End Date
+    cf_ids, cf_start, cf_end = extract_cf_columns(cf_text)
+    # Compare columns to find Start Date and End Date errors
+    start_change = compare_columns(ed_columns[0], ed_start, cf_ids, cf_start,
+                                   ed_columns[2])
+    end_change = compare_columns(ed_columns[0], ed_end, cf_ids, cf_end,
+                                 ed_columns[2])
+    # Save to history and save new changes to csv files
+    metrics = [('Enrolment Dates rows', ed_rows),
+               ('Enrolment Dates course rows', len(ed_columns[0])),
+               ('Custom Fields rows', len(cf_columns[3])),
+               ('Custom Fields student rows', len(cf_text))]
+    process_changes(start_change, end_change, metrics)
     process_warning_log(warnings, warnings_to_process)
 
 
@@ -567,6 +1035,39 @@ def process_error_log(errors, source):
     raise SystemExit
 
 
+def process_history():
+    """Print the change history from the history database.
+    
+    Prints the changes that are new and resolved in the latest run since the
+    last uploaded run, the number of mismatches for each course in each run and the row count for
+    each processing stage in each run.
+    """
+    conn = open_history()
+    try:
+        run_id = conn.execute('SELECT MAX(run_id) FROM runs').fetchone()[0]
+        if run_id is None:
+            print('\nNo runs have been saved to the change history.')
+            return
+        for field in ('Start Date', 'End Date'):
+            print('\nNew {} changes since last uploaded run:'.format(
+                field))
+            for student_id, date in get_new_changes(conn, run_id, field):
+                print(student_id, date)
+            print('\nResolved {} changes since last uploaded '
+                  'run:'.format(field))
+            for student_id, date in get_resolved_changes(conn, run_id,
+                                                         field):
+                print(student_id, date)
+        print('\nMismatches per course:')
+        for run_time, course, field, count in get_course_history(conn):
+            print(run_time, course, field, count)
+        print('\nRows per processing stage:')
+        for run_time, stage, count in get_stage_metrics(conn):
+            print(run_time, stage, count)
+    finally:
+        conn.close()
+
+
 def process_warning_log(warnings, required):
     """Process a Warnings log.
 
@@ -655,6 +1156,45 @@ def save_error_log(source, error_log, file_name):
         print('Error log has been saved to ' + str(file_name))
 
 
+def save_history(conn, changes, metrics):
+    """Save a run's changes and stage row counts to the history database.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+        changes (dict): Lists of [Student ID, date, course code] keyed by
+        field.
+        metrics (list): (stage, row count) for each processing stage.
+    
+    Returns:
+        run_id (int): The run_id of the saved run.
+    """
+    with conn:
+        cursor = conn.execute('INSERT INTO runs (run_time) VALUES (?)',
+                              (generate_time_string(),))
+        run_id = cursor.lastrowid
+        rows = []
+        for field, field_changes in changes.items():
+            for student_id, date, course in field_changes:
+                rows.append((run_id, field, student_id, course, date))
+        conn.executemany('INSERT INTO changes (run_id, field, student_id, '
+                         'course, date) VALUES (?, ?, ?, ?, ?)', rows)
+        conn.executemany('INSERT INTO metrics (run_id, stage, row_count) '
+                         'VALUES (?, ?, ?)',
+                         [(run_id, stage, count) for stage, count in metrics])
+    return run_id
+
+
+def save_upload(conn, run_id):
+    """Record in the history database that a run's upload files were used.
+    
+    Args:
+        conn (Connection): Connection to the history database.
+        run_id (int): The run that was uploaded.
+    """
+    with conn:
+        conn.execute('INSERT INTO uploads (run_id) VALUES (?)', (run_id,))
+
+
 def save_warning_log(warning_log, file_name):
     """Save to file the warnings log.
 